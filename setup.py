@@ -39,6 +39,7 @@ setup(
         ],
         "openai": ["openai>=1.0.0"],
         "anthropic": ["anthropic>=0.5.0"],
+        "fast": ["rapidyaml>=0.13"],
         "all": ["openai>=1.0.0", "anthropic>=0.5.0"],
     },
 ) 
\ No newline at end of file
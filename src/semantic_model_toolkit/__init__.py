@@ -3,32 +3,59 @@
 This library provides tools to generate semantic model YAML strings from Snowflake database tables.
 """
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 
-from semantic_model_toolkit.core.config import (
-    Config,
-    LLMConfig,
-    SemanticModelConfig,
-    SnowflakeConfig,
-    config_from_dict,
-    load_config,
-)
-from semantic_model_toolkit.core.model_generator import (
-    generate_from_file,
-    generate_semantic_model,
-    load_semantic_model_from_file,
-    load_semantic_model_from_string,
-)
+# Public attributes are resolved lazily (PEP 562) so that importing the
+# package does not eagerly pull in heavy dependencies such as
+# snowflake-connector-python and the generated protobuf module.
+_LAZY_ATTRS = {
+    "Config": "semantic_model_toolkit.core.config",
+    "LLMConfig": "semantic_model_toolkit.core.config",
+    "SemanticModelConfig": "semantic_model_toolkit.core.config",
+    "SnowflakeConfig": "semantic_model_toolkit.core.config",
+    "config_from_dict": "semantic_model_toolkit.core.config",
+    "load_config": "semantic_model_toolkit.core.config",
+    "agenerate_many": "semantic_model_toolkit.core.model_generator",
+    "agenerate_semantic_model": "semantic_model_toolkit.core.model_generator",
+    "close_all_connections": "semantic_model_toolkit.core.model_generator",
+    "generate_from_file": "semantic_model_toolkit.core.model_generator",
+    "generate_many": "semantic_model_toolkit.core.model_generator",
+    "generate_semantic_model": "semantic_model_toolkit.core.model_generator",
+    "load_semantic_model_from_file": "semantic_model_toolkit.core.model_generator",
+    "load_semantic_model_from_string": "semantic_model_toolkit.core.model_generator",
+}
 
 __all__ = [
     "Config",
     "LLMConfig",
     "SemanticModelConfig",
     "SnowflakeConfig",
+    "agenerate_many",
+    "agenerate_semantic_model",
+    "close_all_connections",
     "config_from_dict",
     "generate_from_file",
+    "generate_many",
     "generate_semantic_model",
     "load_config",
     "load_semantic_model_from_file",
     "load_semantic_model_from_string",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package module so subsequent lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,45 @@
 """Core functionality for the semantic model generator library."""
 
-from semantic_model_toolkit.core.model_generator import (
-    generate_semantic_model,
-    generate_from_file,
-    load_semantic_model_from_string,
-    load_semantic_model_from_file
-)
+import importlib
+from typing import Any, List
+
+# Resolved lazily (PEP 562), mirroring the package __init__. Eagerly importing
+# model_generator here would close an import cycle: generate_model imports
+# core.config, which initializes this package, and model_generator imports
+# generate_model back while it is still partially initialized.
+_LAZY_ATTRS = {
+    "agenerate_many": "semantic_model_toolkit.core.model_generator",
+    "agenerate_semantic_model": "semantic_model_toolkit.core.model_generator",
+    "close_all_connections": "semantic_model_toolkit.core.model_generator",
+    "generate_many": "semantic_model_toolkit.core.model_generator",
+    "generate_semantic_model": "semantic_model_toolkit.core.model_generator",
+    "generate_from_file": "semantic_model_toolkit.core.model_generator",
+    "load_semantic_model_from_string": "semantic_model_toolkit.core.model_generator",
+    "load_semantic_model_from_file": "semantic_model_toolkit.core.model_generator",
+}
 
 __all__ = [
+    "agenerate_many",
+    "agenerate_semantic_model",
+    "close_all_connections",
+    "generate_many",
     "generate_semantic_model",
     "generate_from_file",
-    "load_semantic_model_from_string", 
+    "load_semantic_model_from_string",
     "load_semantic_model_from_file"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package module so subsequent lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,36 @@
 """Configuration handling for semantic model generator."""
 
+import functools
 import json
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Literal
+import sys
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple, Union, Literal
 
 import yaml
 
+try:
+    # Use the C-accelerated loader when PyYAML was built against libyaml;
+    # it parses the same safe subset of YAML several times faster.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+if sys.version_info >= (3, 10):
+    # slots=True drops the per-instance __dict__, shrinking instances and
+    # speeding up attribute access; frozen=True makes configs hashable so they
+    # can serve as cache keys. slots requires Python 3.10+, so older versions
+    # fall back to frozen-only dataclasses.
+    def _config_dataclass(cls: type) -> type:
+        return dataclass(cls, frozen=True, slots=True)
+
+else:
+
+    def _config_dataclass(cls: type) -> type:
+        return dataclass(cls, frozen=True)
+
+
+@_config_dataclass
 class SnowflakeConfig:
     """Snowflake connection configuration."""
     
@@ -25,7 +47,7 @@ class SnowflakeConfig:
     authenticator: Optional[str] = None
 
 
-@dataclass
+@_config_dataclass
 class SemanticModelConfig:
     """Semantic model configuration."""
     
@@ -35,7 +57,7 @@ class SemanticModelConfig:
     allow_joins: bool = False
 
 
-@dataclass
+@_config_dataclass
 class LLMConfig:
     """LLM configuration for description generation."""
     
@@ -47,12 +69,14 @@ class LLMConfig:
     azure_deployment_name: Optional[str] = None
     temperature: float = 0.2
     max_tokens: Optional[int] = None
+    batch_size: int = 16
+    stream: bool = False
     fallback_provider: Optional[str] = None
     fallback_api_key: Optional[str] = None
     fallback_model: Optional[str] = None
 
 
-@dataclass
+@_config_dataclass
 class Config:
     """Main configuration class for semantic model generator."""
     
@@ -61,63 +85,164 @@ class Config:
     llm: Optional[LLMConfig] = None
 
 
+# Literal type hints are not enforced at runtime, so provider typos would
+# otherwise surface only after a Snowflake connection has been paid for.
+_VALID_PROVIDERS = frozenset({"cortex", "openai", "azure_openai", "anthropic"})
+
+# Field-name tuples precomputed at import time so config_to_dict does not
+# rebuild the attribute lists on every call.
+_SNOWFLAKE_OPTIONAL_FIELDS = tuple(
+    f.name for f in fields(SnowflakeConfig) if f.default is None
+)
+_LLM_OPTIONAL_FIELDS = tuple(
+    f.name for f in fields(LLMConfig) if f.name not in ("provider", "model")
+)
+
+# Cache of parsed config files keyed by (absolute path, mtime, size) so that
+# repeated loads of an unchanged file skip the parse entirely.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Config] = {}
+
+# Opt-in JSON sidecar cache for YAML configs. Parsing JSON is much cheaper than
+# parsing YAML, so when enabled we persist the parsed dict next to the source
+# file and reload it from there as long as the source has not changed.
+_JSON_SIDECAR_ENV_VAR = "SMT_YAML_JSON_CACHE"
+_JSON_SIDECAR_SUFFIX = ".cache.json"
+
+
+def _json_sidecar_enabled() -> bool:
+    return os.environ.get(_JSON_SIDECAR_ENV_VAR) == "1"
+
+
+def _load_yaml_with_sidecar(config_path: str) -> Dict:
+    """Load a YAML config dict, using the JSON sidecar cache when enabled."""
+    sidecar_path = config_path + _JSON_SIDECAR_SUFFIX
+    use_sidecar = _json_sidecar_enabled()
+
+    if use_sidecar and os.path.exists(sidecar_path):
+        if os.path.getmtime(sidecar_path) >= os.path.getmtime(config_path):
+            try:
+                with open(sidecar_path, "rb") as f:
+                    return json.loads(f.read())
+            except (OSError, ValueError):
+                # Corrupt or unreadable sidecar; fall through to the YAML parse.
+                pass
+
+    # Read as bytes: both loaders accept UTF-8 bytes directly, skipping
+    # Python-level newline translation and per-character decoding.
+    with open(config_path, "rb") as f:
+        config_dict = yaml.load(f.read(), Loader=_YamlLoader)
+
+    if use_sidecar:
+        try:
+            with open(sidecar_path, "w") as f:
+                json.dump(config_dict, f)
+        except (OSError, TypeError):
+            # The sidecar is purely an optimization; ignore write failures.
+            pass
+
+    return config_dict
+
+
 def load_config(config_path: str) -> Config:
     """
     Load configuration from a file.
-    
+
+    Repeated calls for the same unchanged file return a cached Config
+    instance, so callers must not mutate the returned object.
+
     Args:
         config_path: Path to the configuration file (JSON or YAML)
-        
+
     Returns:
         Config object
     """
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
+
+    stat = os.stat(config_path)
+    cache_key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+    if cache_key in _CONFIG_CACHE:
+        return _CONFIG_CACHE[cache_key]
+
     # Determine file type by extension
     _, ext = os.path.splitext(config_path)
-    
-    with open(config_path, "r") as f:
-        if ext.lower() in [".yaml", ".yml"]:
-            config_dict = yaml.safe_load(f)
-        elif ext.lower() == ".json":
-            config_dict = json.load(f)
-        else:
-            raise ValueError(f"Unsupported configuration file format: {ext}")
-    
-    return parse_config_dict(config_dict)
+
+    if ext.lower() in [".yaml", ".yml"]:
+        config_dict = _load_yaml_with_sidecar(config_path)
+    elif ext.lower() == ".json":
+        with open(config_path, "rb") as f:
+            config_dict = json.loads(f.read())
+    else:
+        raise ValueError(f"Unsupported configuration file format: {ext}")
+
+    config = parse_config_dict(config_dict)
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
+
+def _migrate_llm_legacy(llm_dict: Dict) -> Dict:
+    """
+    Migrate the legacy use_cortex/fallback_service llm config format.
+
+    Pure function: returns a new dict and leaves the input untouched.
+
+    Args:
+        llm_dict: The llm sub-dictionary of a configuration dictionary
+
+    Returns:
+        A new dict in the current provider-based format
+    """
+    migrated = dict(llm_dict)
+    if "use_cortex" in migrated and "provider" not in migrated:
+        if migrated["use_cortex"]:
+            migrated["provider"] = "cortex"
+        elif "fallback_service" in migrated:
+            migrated["provider"] = migrated.get("fallback_service", "openai")
+            migrated["api_key"] = migrated.get("fallback_api_key")
+
+        # Remove legacy fields to avoid conflicts
+        migrated.pop("use_cortex", None)
+        migrated.pop("fallback_service", None)
+        migrated.pop("fallback_api_key", None)
+    return migrated
+
+
+@functools.lru_cache(maxsize=64)
+def _migrate_llm_legacy_cached(serialized: str) -> Dict:
+    """Memoized migration keyed on the JSON-serialized llm sub-dict."""
+    return _migrate_llm_legacy(json.loads(serialized))
 
 
 def parse_config_dict(config_dict: Dict) -> Config:
     """
     Parse a configuration dictionary into a Config object.
-    
+
     Args:
         config_dict: Configuration dictionary
-        
+
     Returns:
         Config object
     """
     snowflake_config = SnowflakeConfig(**config_dict["snowflake"])
     semantic_model_config = SemanticModelConfig(**config_dict["semantic_model"])
-    
+
     llm_config = None
     if "llm" in config_dict:
-        # Convert from legacy format if needed
-        if "use_cortex" in config_dict["llm"] and "provider" not in config_dict["llm"]:
-            if config_dict["llm"]["use_cortex"]:
-                config_dict["llm"]["provider"] = "cortex"
-            elif "fallback_service" in config_dict["llm"]:
-                config_dict["llm"]["provider"] = config_dict["llm"].get("fallback_service", "openai")
-                config_dict["llm"]["api_key"] = config_dict["llm"].get("fallback_api_key")
-            
-            # Remove legacy fields to avoid conflicts
-            config_dict["llm"].pop("use_cortex", None)
-            config_dict["llm"].pop("fallback_service", None)
-            config_dict["llm"].pop("fallback_api_key", None)
-            
-        llm_config = LLMConfig(**config_dict["llm"])
-    
+        try:
+            llm_dict = _migrate_llm_legacy_cached(
+                json.dumps(config_dict["llm"], sort_keys=True)
+            )
+        except TypeError:
+            # Not JSON-serializable; migrate without memoization.
+            llm_dict = _migrate_llm_legacy(config_dict["llm"])
+
+        llm_config = LLMConfig(**llm_dict)
+        if llm_config.provider not in _VALID_PROVIDERS:
+            raise ValueError(
+                f"Unsupported LLM provider: {llm_config.provider}. "
+                f"Supported providers: {', '.join(sorted(_VALID_PROVIDERS))}"
+            )
+
     return Config(
         snowflake=snowflake_config,
         semantic_model=semantic_model_config,
@@ -162,23 +287,28 @@ def config_to_dict(config: Config) -> Dict:
     }
     
     # Add optional Snowflake parameters
-    for attr in ["password", "role", "warehouse", "database", "schema", 
-                 "private_key_path", "private_key_passphrase", "token", "authenticator"]:
-        if getattr(config.snowflake, attr) is not None:
-            result["snowflake"][attr] = getattr(config.snowflake, attr)
-    
+    result["snowflake"].update(
+        {
+            name: value
+            for name in _SNOWFLAKE_OPTIONAL_FIELDS
+            if (value := getattr(config.snowflake, name)) is not None
+        }
+    )
+
     # Add LLM config if present
     if config.llm is not None:
         result["llm"] = {
             "provider": config.llm.provider,
             "model": config.llm.model,
         }
-        
+
         # Add optional LLM parameters
-        for attr in ["api_key", "api_endpoint", "api_version", "azure_deployment_name", 
-                    "temperature", "max_tokens", "fallback_provider", "fallback_api_key", 
-                    "fallback_model"]:
-            if getattr(config.llm, attr) is not None:
-                result["llm"][attr] = getattr(config.llm, attr)
-    
-    return result 
\ No newline at end of file
+        result["llm"].update(
+            {
+                name: value
+                for name in _LLM_OPTIONAL_FIELDS
+                if (value := getattr(config.llm, name)) is not None
+            }
+        )
+
+    return result
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Main entry point for semantic model generation."""
 
-from typing import Dict, Optional, Union
+import asyncio
+import functools
+import os
+from typing import Dict, List, Optional, Union
 
 from loguru import logger
 from snowflake.connector import SnowflakeConnection
@@ -8,13 +11,21 @@ from snowflake.connector import SnowflakeConnection
 from semantic_model_toolkit.core.config import Config, config_from_dict, load_config
 from semantic_model_toolkit.data_processing import proto_utils
 from semantic_model_toolkit.protos import semantic_model_pb2
-from semantic_model_toolkit.snowflake_utils.utils import create_snowflake_connection
+from semantic_model_toolkit.snowflake_utils.utils import (
+    close_pooled_connections,
+    create_snowflake_connection,
+)
 from semantic_model_toolkit.generate_model import (
     generate_model_str_from_snowflake,
     raw_schema_to_semantic_context,
 )
 
 
+def close_all_connections() -> None:
+    """Close and discard all pooled Snowflake connections."""
+    close_pooled_connections()
+
+
 def generate_semantic_model(
     config: Union[Dict, Config],
     snowflake_connection: Optional[SnowflakeConnection] = None,
@@ -40,15 +51,17 @@ def generate_semantic_model(
                 - api_key: API key for the LLM service
                 - Other provider-specific parameters
         snowflake_connection: Optional pre-established Snowflake connection
-        
+
     Returns:
         The generated semantic model as a YAML string
     """
     # Convert dict to Config object if needed
     if isinstance(config, dict):
         config = config_from_dict(config)
-    
-    # Create Snowflake connection if not provided
+
+    # Reuse a pooled Snowflake connection (or create and pool one) if the
+    # caller did not provide their own. The pool recycles connections past
+    # their lifespan; use close_all_connections() for clean shutdown.
     if not snowflake_connection:
         snowflake_connection = create_snowflake_connection(
             account=config.snowflake.account,
@@ -62,28 +75,78 @@ def generate_semantic_model(
             private_key_passphrase=config.snowflake.private_key_passphrase,
             token=config.snowflake.token,
             authenticator=config.snowflake.authenticator,
+            use_pool=True,
         )
-    
-    try:
-        # Generate YAML directly from Snowflake
-        yaml_str = generate_model_str_from_snowflake(
-            base_tables=config.semantic_model.base_tables,
-            semantic_model_name=config.semantic_model.name,
-            conn=snowflake_connection,
-            n_sample_values=config.semantic_model.n_sample_values,
-            allow_joins=config.semantic_model.allow_joins,
-            llm_config=config.llm,
-        )
-        
-        return yaml_str
-    
-    finally:
-        # Close connection if we created it
-        if snowflake_connection and not hasattr(snowflake_connection, '_is_closed'):
-            try:
-                snowflake_connection.close()
-            except:
-                pass
+
+    # Generate YAML directly from Snowflake. The connection is left open:
+    # pooled connections are reused by later calls and caller-provided
+    # connections remain the caller's responsibility.
+    yaml_str = generate_model_str_from_snowflake(
+        base_tables=config.semantic_model.base_tables,
+        semantic_model_name=config.semantic_model.name,
+        conn=snowflake_connection,
+        n_sample_values=config.semantic_model.n_sample_values,
+        allow_joins=config.semantic_model.allow_joins,
+        llm_config=config.llm,
+    )
+
+    return yaml_str
+
+
+async def agenerate_semantic_model(
+    config: Union[Dict, Config],
+    snowflake_connection: Optional[SnowflakeConnection] = None,
+) -> str:
+    """
+    Async counterpart of generate_semantic_model.
+
+    The generation pipeline is I/O-bound (Snowflake metadata queries and LLM
+    calls), so it is run in a worker thread via run_in_executor (rather than
+    asyncio.to_thread, which requires Python 3.9 while the package supports
+    3.8). This keeps the event loop free, allowing several models to be
+    generated concurrently.
+
+    Args:
+        config: Configuration dictionary or Config object (see
+            generate_semantic_model for the expected structure)
+        snowflake_connection: Optional pre-established Snowflake connection
+
+    Returns:
+        The generated semantic model as a YAML string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(generate_semantic_model, config, snowflake_connection),
+    )
+
+
+async def agenerate_many(configs: List[Union[Dict, Config]]) -> List[str]:
+    """
+    Generate several semantic models concurrently on the running event loop.
+
+    Args:
+        configs: List of configuration dictionaries or Config objects
+
+    Returns:
+        List of generated semantic model YAML strings, in input order
+    """
+    return list(
+        await asyncio.gather(*[agenerate_semantic_model(c) for c in configs])
+    )
+
+
+def generate_many(configs: List[Union[Dict, Config]]) -> List[str]:
+    """
+    Synchronous wrapper around agenerate_many for callers without an event loop.
+
+    Args:
+        configs: List of configuration dictionaries or Config objects
+
+    Returns:
+        List of generated semantic model YAML strings, in input order
+    """
+    return asyncio.run(agenerate_many(configs))
 
 
 def generate_from_file(config_path: str) -> str:
@@ -113,17 +176,38 @@ def load_semantic_model_from_string(yaml_str: str) -> semantic_model_pb2.Semanti
     return proto_utils.yaml_to_semantic_model(yaml_str)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_semantic_model_bytes(file_path: str, mtime_ns: int) -> bytes:
+    """
+    Parse a semantic model YAML file and cache its serialized protobuf form.
+
+    The YAML parse plus proto conversion dominates load cost; caching the
+    serialized bytes keyed by (path, mtime) means repeated loads of an
+    unchanged file only pay the cheap protobuf deserialization.
+    """
+    with open(file_path, 'r') as f:
+        yaml_str = f.read()
+
+    return load_semantic_model_from_string(yaml_str).SerializeToString()
+
+
 def load_semantic_model_from_file(file_path: str) -> semantic_model_pb2.SemanticModel:
     """
     Load a semantic model from a YAML file.
-    
+
+    Results are cached by file path and modification time, so repeated loads
+    of an unchanged file skip the YAML parse. A fresh protobuf object is
+    returned on every call and is safe for the caller to mutate.
+
     Args:
         file_path: Path to the YAML file
-        
+
     Returns:
         Semantic model as a protobuf object
     """
-    with open(file_path, 'r') as f:
-        yaml_str = f.read()
-    
-    return load_semantic_model_from_string(yaml_str) 
\ No newline at end of file
+    stat = os.stat(file_path)
+    buf = _load_semantic_model_bytes(file_path, stat.st_mtime_ns)
+
+    model = semantic_model_pb2.SemanticModel()
+    model.ParseFromString(buf)
+    return model 
\ No newline at end of file
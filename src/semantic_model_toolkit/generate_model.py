@@ -1,14 +1,13 @@
 import os
 from datetime import datetime
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from loguru import logger
 from snowflake.connector import SnowflakeConnection
 
 from semantic_model_toolkit.core.config import Config, LLMConfig
 from semantic_model_toolkit.data_processing import data_types, proto_utils
-from semantic_model_toolkit.llm_utils import get_llm_client
 from semantic_model_toolkit.protos import semantic_model_pb2
 from semantic_model_toolkit.snowflake_utils.snowflake_connector import (
     AUTOGEN_TOKEN,
@@ -178,6 +177,9 @@ def generate_description_with_llm(context: str, entity_type: str, entity_name: s
     
     # Create the LLM client based on configuration
     try:
+        # Imported locally to avoid a circular import with llm_utils.
+        from semantic_model_toolkit.llm_utils import get_llm_client
+
         llm_client = get_llm_client(llm_config)
         
         # Connect the Snowflake connection to the Cortex LLM client if applicable
@@ -195,6 +197,65 @@ def generate_description_with_llm(context: str, entity_type: str, entity_name: s
         return _PLACEHOLDER_COMMENT
 
 
+def generate_descriptions_with_llm(
+    items: List[Tuple[str, str, str]],
+    conn: SnowflakeConnection,
+    llm_config: Optional[LLMConfig] = None,
+) -> Dict[str, str]:
+    """
+    Generate descriptions for several entities using batched LLM calls.
+
+    Entities are handed to LLMClient.generate_descriptions, which chunks them
+    into groups of llm_config.batch_size so one LLM round trip covers a whole
+    batch. Entities missing from the batched replies fall back to individual
+    calls.
+
+    Args:
+        items: List of (entity_name, entity_type, context) tuples
+        conn: Snowflake connection (for Cortex LLM)
+        llm_config: LLM configuration
+
+    Returns:
+        Mapping of entity name to generated description
+    """
+    if not llm_config:
+        return {name: _PLACEHOLDER_COMMENT for name, _, _ in items}
+
+    descriptions: Dict[str, str] = {}
+    try:
+        # Imported locally to avoid a circular import with llm_utils.
+        from semantic_model_toolkit.llm_utils import get_llm_client
+
+        llm_client = get_llm_client(llm_config)
+
+        # Connect the Snowflake connection to the Cortex LLM client if applicable
+        if llm_config.provider == "cortex" and hasattr(llm_client, "connect"):
+            llm_client.connect(conn)
+
+        batched = llm_client.generate_descriptions(
+            [
+                (name, f"type: {entity_type}\n{entity_context.strip()}")
+                for name, entity_type, entity_context in items
+            ],
+            batch_size=llm_config.batch_size,
+        )
+        descriptions = {
+            name: description + _AUTOGEN_COMMENT_TOKEN
+            for name, description in batched.items()
+        }
+    except Exception as e:
+        logger.error(f"Error generating batched descriptions with LLM: {e}")
+
+    # Individually retry anything the batched replies did not cover.
+    for name, entity_type, entity_context in items:
+        if name not in descriptions:
+            descriptions[name] = generate_description_with_llm(
+                entity_context, entity_type, name, conn, llm_config
+            )
+
+    return descriptions
+
+
 def generate_synonyms_with_llm(context: str, entity_type: str, entity_name: str, conn: SnowflakeConnection, llm_config: Optional[LLMConfig] = None) -> List[str]:
     """
     Generate synonyms for an entity using an LLM.
@@ -213,6 +274,9 @@ def generate_synonyms_with_llm(context: str, entity_type: str, entity_name: str,
         return [_PLACEHOLDER_COMMENT]
     
     try:
+        # Imported locally to avoid a circular import with llm_utils.
+        from semantic_model_toolkit.llm_utils import get_llm_client
+
         llm_client = get_llm_client(llm_config)
         
         # Connect the Snowflake connection to the Cortex LLM client if applicable
@@ -231,6 +295,18 @@ def generate_synonyms_with_llm(context: str, entity_type: str, entity_name: str,
         return [_PLACEHOLDER_COMMENT]
 
 
+def _column_entity_type(col: data_types.Column) -> str:
+    """Map a column's datatype to the entity type used in LLM prompts."""
+    dtype = col.column_type.upper()
+    if dtype in TIME_MEASURE_DATATYPES:
+        return "time dimension column"
+    if dtype in DIMENSION_DATATYPES:
+        return "dimension column"
+    if dtype in MEASURE_DATATYPES:
+        return "measure column"
+    return "general column"
+
+
 def _raw_table_to_semantic_context_table(
     database: str, schema: str, raw_table: data_types.Table, conn: SnowflakeConnection, llm_config: Optional[LLMConfig] = None
 ) -> semantic_model_pb2.Table:
@@ -271,13 +347,28 @@ Data Type: {col.column_type}
 Sample Values: {sample_values_str}
 """
 
+    # Batch LLM description generation: one call covers up to
+    # llm_config.batch_size columns instead of one call per column.
+    pending_items = [
+        (
+            col.column_name,
+            _column_entity_type(col),
+            _prepare_column_context(col, raw_table.name),
+        )
+        for col in raw_table.columns
+        if not col.comment and col.column_type.upper() not in OBJECT_DATATYPES
+    ]
+    column_descriptions = generate_descriptions_with_llm(
+        pending_items, conn, llm_config
+    )
+
     for col in raw_table.columns:
         # Prepare enhanced context for LLM description generation
         column_context = _prepare_column_context(col, raw_table.name)
-        
+
         if col.column_type.upper() in TIME_MEASURE_DATATYPES:
-            description = col.comment if col.comment else generate_description_with_llm(
-                column_context, "time dimension column", col.column_name, conn, llm_config
+            description = col.comment if col.comment else column_descriptions.get(
+                col.column_name, _PLACEHOLDER_COMMENT
             )
             synonyms = generate_synonyms_with_llm(
                 column_context, "time dimension column", col.column_name, conn, llm_config
@@ -295,8 +386,8 @@ Sample Values: {sample_values_str}
             )
 
         elif col.column_type.upper() in DIMENSION_DATATYPES:
-            description = col.comment if col.comment else generate_description_with_llm(
-                column_context, "dimension column", col.column_name, conn, llm_config
+            description = col.comment if col.comment else column_descriptions.get(
+                col.column_name, _PLACEHOLDER_COMMENT
             )
             synonyms = generate_synonyms_with_llm(
                 column_context, "dimension column", col.column_name, conn, llm_config
@@ -314,8 +405,8 @@ Sample Values: {sample_values_str}
             )
 
         elif col.column_type.upper() in MEASURE_DATATYPES:
-            description = col.comment if col.comment else generate_description_with_llm(
-                column_context, "measure column", col.column_name, conn, llm_config
+            description = col.comment if col.comment else column_descriptions.get(
+                col.column_name, _PLACEHOLDER_COMMENT
             )
             synonyms = generate_synonyms_with_llm(
                 column_context, "measure column", col.column_name, conn, llm_config
@@ -341,8 +432,8 @@ Sample Values: {sample_values_str}
                 f"Column datatype does not map to a known datatype. Input was = {col.column_type}. We are going to place as a Dimension for now."
             )
             
-            description = col.comment if col.comment else generate_description_with_llm(
-                column_context, "general column", col.column_name, conn, llm_config
+            description = col.comment if col.comment else column_descriptions.get(
+                col.column_name, _PLACEHOLDER_COMMENT
             )
             synonyms = generate_synonyms_with_llm(
                 column_context, "general column", col.column_name, conn, llm_config
@@ -413,25 +504,40 @@ def raw_schema_to_semantic_context(
     - AssertionError: If no valid tables are found in the specified schema.
     """
 
-    # For FQN tables, create a new snowflake connection per table in case the db/schema is different.
-    table_objects = []
-    unique_database_schema: List[str] = []
-    for table in base_tables:
-        # Verify this is a valid FQN table. For now, we check that the table follows the following format.
-        # {database}.{schema}.{table}
-        fqn_table = create_fqn_table(table)
-        fqn_databse_schema = f"{fqn_table.database}.{fqn_table.schema_name}"
-
-        if fqn_databse_schema not in unique_database_schema:
-            unique_database_schema.append(fqn_databse_schema)
-
-        logger.info(f"Pulling column information from {fqn_table}")
-        valid_schemas_tables_columns_df = get_valid_schemas_tables_columns_df(
+    # Verify these are valid FQN tables. For now, we check that each table follows the following format.
+    # {database}.{schema}.{table}
+    fqn_tables = [create_fqn_table(table) for table in base_tables]
+
+    # Bulk-fetch column metadata once per unique (database, schema) pair,
+    # collapsing the per-table information_schema queries into one round trip
+    # per schema; each table's columns are then sliced out in Python.
+    columns_df_by_schema = {}
+    for fqn_table in fqn_tables:
+        schema_key = (fqn_table.database, fqn_table.schema_name)
+        if schema_key in columns_df_by_schema:
+            continue
+        tables_in_schema = [
+            t.table
+            for t in fqn_tables
+            if (t.database, t.schema_name) == schema_key
+        ]
+        logger.info(
+            f"Pulling column information for {len(tables_in_schema)} table(s) from {fqn_table.database}.{fqn_table.schema_name}"
+        )
+        columns_df_by_schema[schema_key] = get_valid_schemas_tables_columns_df(
             conn=conn,
             db_name=fqn_table.database,
             table_schema=fqn_table.schema_name,
-            table_names=[fqn_table.table],
+            table_names=tables_in_schema,
         )
+
+    table_objects = []
+    for fqn_table in fqn_tables:
+        fqn_databse_schema = f"{fqn_table.database}.{fqn_table.schema_name}"
+
+        valid_schemas_tables_columns_df = columns_df_by_schema[
+            (fqn_table.database, fqn_table.schema_name)
+        ]
         assert not valid_schemas_tables_columns_df.empty
 
         # get the valid columns for this table.
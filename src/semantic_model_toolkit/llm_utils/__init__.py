@@ -1,5 +1,10 @@
 """Utilities for interacting with different LLM providers."""
 
-from semantic_model_toolkit.llm_utils.llm_client import get_llm_client
+from semantic_model_toolkit.llm_utils.llm_client import (
+    agenerate_many,
+    generate_batch,
+    get_llm_client,
+)
+from semantic_model_toolkit.llm_utils.semantic_cache import SemanticCache
 
-__all__ = ["get_llm_client"] 
\ No newline at end of file
+__all__ = ["SemanticCache", "agenerate_many", "generate_batch", "get_llm_client"]
\ No newline at end of file
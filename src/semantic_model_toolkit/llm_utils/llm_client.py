@@ -1,18 +1,229 @@
 """Client for interacting with various LLM providers."""
 
+import asyncio
+import functools
+import json
 import os
+import random
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 
 from loguru import logger
 from snowflake.connector import SnowflakeConnection
+from snowflake.connector.errors import ProgrammingError
 
 from semantic_model_toolkit.core.config import LLMConfig
+from semantic_model_toolkit.llm_utils.semantic_cache import SemanticCache
+
+# Provider SDKs are optional dependencies. Import them once at module scope
+# instead of inside every client __init__, so repeated client construction
+# (e.g. for fallback clients) skips the sys.modules lookup.
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Retry policy for transient provider failures: exponential backoff with
+# jitter so concurrent clients do not retry in lockstep past a rate limit.
+_MAX_RETRY_ATTEMPTS = 5
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_MAX_SECONDS = 30.0
+
+
+def _is_retryable_error(e: Exception) -> bool:
+    """Classify an exception as transient (rate limit, connection drop, 5xx)."""
+    if openai is not None:
+        if isinstance(e, (openai.RateLimitError, openai.APIConnectionError)):
+            return True
+        if isinstance(e, openai.APIStatusError):
+            return e.status_code >= 500
+    if anthropic is not None:
+        if isinstance(e, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+            return True
+        if isinstance(e, anthropic.APIStatusError):
+            return e.status_code >= 500
+    if isinstance(e, ProgrammingError):
+        # Snowflake surfaces Cortex throttling as ProgrammingError; retry
+        # only messages that clearly indicate throttling.
+        message = str(e).lower()
+        return "429" in message or "throttl" in message or "too many requests" in message
+    return False
+
+
+def _retry_delay(attempt: int) -> float:
+    return min(_RETRY_BASE_SECONDS * 2**attempt + random.random(), _RETRY_MAX_SECONDS)
+
+
+def _call_with_retries(fn: Callable[[], str]) -> str:
+    """Run an LLM call, retrying transient errors with backoff and jitter."""
+    for attempt in range(_MAX_RETRY_ATTEMPTS):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == _MAX_RETRY_ATTEMPTS - 1 or not _is_retryable_error(e):
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(
+                f"Transient LLM error ({e}); retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_RETRY_ATTEMPTS})"
+            )
+            time.sleep(delay)
+
+
+async def _acall_with_retries(fn: Callable[[], Any]) -> str:
+    """Async counterpart of _call_with_retries for the native async clients."""
+    for attempt in range(_MAX_RETRY_ATTEMPTS):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == _MAX_RETRY_ATTEMPTS - 1 or not _is_retryable_error(e):
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(
+                f"Transient LLM error ({e}); retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_RETRY_ATTEMPTS})"
+            )
+            await asyncio.sleep(delay)
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoder() -> Any:
+    """Return the shared tiktoken encoder, or None when tiktoken is absent."""
+    if tiktoken is None:
+        return None
+    # cl100k_base is a close enough approximation for the Llama-family
+    # models Cortex serves; only the token count matters here.
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_sdk_client(factory: Any, **kwargs: Any) -> Any:
+    """
+    Create, or reuse, an SDK client for the given factory and arguments.
+
+    Memoizing on the constructor arguments means multiple LLM client
+    instances with the same credentials share one SDK client and therefore
+    one underlying httpx connection pool.
+    """
+    return factory(**kwargs)
+
+
+def _parse_json_object(reply: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON object out of an LLM reply, tolerating surrounding text."""
+    start_idx = reply.find("{")
+    end_idx = reply.rfind("}")
+    if start_idx < 0 or end_idx <= start_idx:
+        return None
+    try:
+        parsed = json.loads(reply[start_idx : end_idx + 1])
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+_BATCH_PROMPT = (
+    "Generate a clear, concise description for each of the items below. "
+    "Keep each description factual and brief (1-2 sentences). Return only a "
+    "JSON object mapping each item id to its description, without any other text."
+)
+
+_ITEM_PROMPT = (
+    "Generate a clear, concise description for the item below. "
+    "Keep it factual and brief (1-2 sentences). Only return the "
+    "description without any other text."
+)
+
+# Strips surrounding whitespace and the conversational preambles models
+# sometimes prepend despite the prompt ("Sure! ...", "Here's the
+# description: ...") in a single compiled pass. Both preamble forms are
+# deliberately narrow — "sure" requires a word boundary so "Surely ..." is
+# untouched, and the "here is"/"here's" form only matches the literal
+# "... description ...:" lead-in so colons inside genuine first sentences
+# survive.
+_POST = re.compile(
+    r"^\s*"
+    r"(?:sure\b[!.,:]?\s*)?"
+    r"(?:here(?:'s| is)\s+(?:the\s+|a\s+)?description\b[^:\n]*:\s*)?"
+    r"(.*?)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Shared system instruction. Kept byte-identical across all calls in a run so
+# provider-side prompt caches (OpenAI's automatic prefix cache, Anthropic's
+# ephemeral cache_control) can serve it at a fraction of the input-token cost.
+_SYSTEM_PROMPT = "You are a helpful assistant for generating semantic model descriptions."
+
+
+def _log_prompt_cache_usage(usage: Any) -> None:
+    """Log provider-reported prompt-cache hits, when the SDK exposes them."""
+    if usage is None:
+        return
+    # OpenAI reports cached_tokens under prompt_tokens_details; Anthropic
+    # reports cache_read_input_tokens directly on usage.
+    cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+    if cached is None:
+        cached = getattr(usage, "cache_read_input_tokens", None)
+    if cached:
+        logger.debug(f"Prompt cache served {cached} input tokens")
 
 
 class LLMClient(ABC):
     """Abstract base class for LLM client implementations."""
-    
+
+    # Default number of items folded into one batched description call. Reply
+    # quality degrades for very large batches, so batches are split in half
+    # whenever a reply cannot be parsed as JSON.
+    DEFAULT_BATCH_SIZE = 16
+
+    # Optional semantic response cache. Assign a SemanticCache instance to
+    # serve repeated (and, with an embedding function, near-duplicate)
+    # prompts without paying for a live LLM call.
+    cache: Optional[SemanticCache] = None
+
+    # Secondary client consulted when the primary call fails. The class-level
+    # None default makes the error paths a plain truthiness check instead of
+    # a hasattr probe on every failure.
+    fallback_client: Optional["LLMClient"] = None
+
+    @staticmethod
+    def _postprocess(text: str) -> str:
+        """Normalize a model reply: trim whitespace and common preambles."""
+        return _POST.match(text).group(1)
+
+    def _cached_call(self, full_prompt: str, fn: Callable[[], str]) -> str:
+        """
+        Run an LLM call through the semantic cache, if one is attached.
+
+        Args:
+            full_prompt (str): The full prompt text, used as the cache key
+            fn (Callable[[], str]): Zero-argument callable performing the
+                actual LLM call on a cache miss
+
+        Returns:
+            str: The cached or freshly generated response
+        """
+        if self.cache is None:
+            return _call_with_retries(fn)
+        model = getattr(self, "model", type(self).__name__)
+        cached = self.cache.lookup(model, full_prompt)
+        if cached is not None:
+            logger.debug("Semantic cache hit for LLM prompt")
+            return cached
+        response = _call_with_retries(fn)
+        self.cache.store(model, full_prompt, response)
+        return response
+
     @abstractmethod
     def generate_description(self, context: str, prompt: str) -> str:
         """
@@ -27,10 +238,164 @@ class LLMClient(ABC):
         """
         pass
 
+    async def agenerate_description(self, context: str, prompt: str) -> str:
+        """
+        Async counterpart of generate_description.
+
+        The default implementation runs the blocking generate_description in a
+        worker thread so several descriptions can be in flight concurrently;
+        subclasses with native async SDKs override this.
+
+        Args:
+            context (str): Context information to include in the prompt
+            prompt (str): The prompt template to use
+
+        Returns:
+            str: The generated description
+        """
+        # run_in_executor rather than asyncio.to_thread, which requires
+        # Python 3.9 while the package supports 3.8.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_description, context, prompt)
+        )
+
+    def generate_descriptions(
+        self,
+        items: List[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Generate descriptions for several items using batched LLM calls.
+
+        Items are chunked and each chunk is sent as a single prompt asking the
+        model to return a JSON object mapping item id to description, which
+        amortizes the shared prompt and the per-call round trip across the
+        batch. Batches whose reply cannot be parsed are split in half and
+        retried; single items fall back to a plain generate_description call.
+
+        Args:
+            items (List[Tuple[str, str]]): List of (id, context) tuples
+            batch_size (Optional[int]): Items per call; defaults to
+                DEFAULT_BATCH_SIZE
+            cached_prefix (Optional[str]): Preamble shared by every batch,
+                placed at the head of the context so provider prompt caches
+                only pay for it once per run
+
+        Returns:
+            Dict[str, str]: Mapping of item id to generated description
+        """
+        if batch_size is None:
+            batch_size = self.DEFAULT_BATCH_SIZE
+        batch_size = max(batch_size, 1)
+
+        descriptions: Dict[str, str] = {}
+        for start in range(0, len(items), batch_size):
+            self._generate_descriptions_batch(
+                items[start : start + batch_size], descriptions, cached_prefix
+            )
+        return descriptions
+
+    def _generate_descriptions_batch(
+        self,
+        batch: List[Tuple[str, str]],
+        descriptions: Dict[str, str],
+        cached_prefix: Optional[str] = None,
+    ) -> None:
+        """Generate one batch of descriptions, splitting on parse failures."""
+        if len(batch) == 1:
+            item_id, context = batch[0]
+            if cached_prefix:
+                context = f"{cached_prefix}\n\n{context}"
+            descriptions[item_id] = self.generate_description(context, _ITEM_PROMPT)
+            return
+
+        context = "\n\n".join(
+            f"id={item_id}:\n{item_context}" for item_id, item_context in batch
+        )
+        if cached_prefix:
+            # The stable preamble goes first so every batch shares the same
+            # prompt prefix.
+            context = f"{cached_prefix}\n\n{context}"
+        reply = self.generate_description(context, _BATCH_PROMPT)
+        parsed = _parse_json_object(reply)
+        if parsed is None:
+            # The model did not return valid JSON; halve the batch and retry.
+            logger.warning(
+                f"Could not parse batched LLM reply as JSON; retrying {len(batch)} items in smaller batches"
+            )
+            mid = len(batch) // 2
+            self._generate_descriptions_batch(batch[:mid], descriptions, cached_prefix)
+            self._generate_descriptions_batch(batch[mid:], descriptions, cached_prefix)
+            return
+
+        missing = [item for item in batch if item[0] not in parsed]
+        descriptions.update(
+            {item_id: str(parsed[item_id]) for item_id, _ in batch if item_id in parsed}
+        )
+        for item in missing:
+            self._generate_descriptions_batch([item], descriptions, cached_prefix)
+
+
+async def agenerate_many(
+    client: LLMClient,
+    pairs: List[Tuple[str, str]],
+    max_concurrency: int = 16,
+) -> List[str]:
+    """
+    Generate descriptions for several (context, prompt) pairs concurrently.
+
+    Args:
+        client (LLMClient): The LLM client to use
+        pairs (List[Tuple[str, str]]): List of (context, prompt) pairs
+        max_concurrency (int): Maximum number of in-flight requests
+
+    Returns:
+        List[str]: Generated descriptions, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _bounded(context: str, prompt: str) -> str:
+        async with semaphore:
+            return await client.agenerate_description(context, prompt)
+
+    return list(
+        await asyncio.gather(*[_bounded(context, prompt) for context, prompt in pairs])
+    )
+
+
+def generate_batch(
+    client: LLMClient,
+    pairs: List[Tuple[str, str]],
+    max_concurrency: int = 16,
+) -> List[str]:
+    """
+    Synchronous wrapper around agenerate_many for callers without an event loop.
+
+    Args:
+        client (LLMClient): The LLM client to use
+        pairs (List[Tuple[str, str]]): List of (context, prompt) pairs
+        max_concurrency (int): Maximum number of in-flight requests
+
+    Returns:
+        List[str]: Generated descriptions, in input order
+    """
+    return asyncio.run(agenerate_many(client, pairs, max_concurrency))
+
 
 class CortexLLMClient(LLMClient):
     """Client for Snowflake Cortex LLM."""
-    
+
+    # Context window of the Cortex-served models this client targets, and the
+    # slice of it reserved for the model's response.
+    MAX_PROMPT_TOKENS = 8192
+    RESPONSE_TOKEN_RESERVE = 512
+
+    # Snowflake rejects statements over 1 MB; size batches well under that
+    # to leave headroom for the SQL scaffolding around the bound values.
+    MAX_BATCH_STATEMENT_BYTES = 900_000
+
     def __init__(self, config: LLMConfig):
         """
         Initialize the Cortex LLM client.
@@ -42,17 +407,155 @@ class CortexLLMClient(LLMClient):
         self._conn = None  # Will be set when connecting to Snowflake
         self.timeout = 30  # Set a default timeout of 30 seconds
         logger.info(f"Initialized Cortex LLM client with model: {self.model}")
-    
+
     def connect(self, conn: SnowflakeConnection):
         """
         Set the Snowflake connection to use for Cortex LLM calls.
-        
+
         Args:
             conn: Snowflake connection object
         """
+        if conn is self._conn:
+            return
+        # Cortex statements are bounded client-side via the execute timeout
+        # kwarg, so the session-level STATEMENT_TIMEOUT_IN_SECONDS is left
+        # alone: the connection is shared (and pooled across runs), and a
+        # latched session timeout would also kill unrelated metadata and
+        # sampling queries. Cursors are created per call: the connector allows
+        # sharing connections across threads but not cursors, and the async
+        # helpers run calls on worker threads.
         self._conn = conn
         logger.info("Connected Cortex LLM client to Snowflake")
-    
+
+    def _truncate_prompt(self, full_prompt: str) -> str:
+        """
+        Truncate a prompt to the model's token budget.
+
+        Uses tiktoken when available, which preserves far more usable context
+        than character slicing (and does not over-truncate non-ASCII text);
+        otherwise falls back to the original character limit.
+
+        Args:
+            full_prompt (str): The prompt to truncate
+
+        Returns:
+            str: The prompt, truncated if it exceeded the budget
+        """
+        encoder = _token_encoder()
+        if encoder is not None:
+            ids = encoder.encode(full_prompt)
+            budget = self.MAX_PROMPT_TOKENS - self.RESPONSE_TOKEN_RESERVE
+            if len(ids) > budget:
+                logger.warning(
+                    f"Trimming prompt from {len(ids)} to {budget} tokens ({len(ids) - budget} tokens dropped)"
+                )
+                return encoder.decode(ids[:budget])
+            return full_prompt
+
+        # tiktoken not installed; fall back to the character-based limit to
+        # stay under Snowflake query size limits.
+        if len(full_prompt) > 10000:
+            logger.warning(f"Trimming prompt from {len(full_prompt)} to 10000 characters")
+            return full_prompt[:10000]
+        return full_prompt
+
+    def _complete_batch(self, items: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Evaluate COMPLETE over many prompts in one round trip per chunk.
+
+        The prompts are bound into a VALUES table so Snowflake evaluates the
+        whole chunk in a single statement, instead of one statement (and one
+        network round trip) per prompt. Chunks are sized by payload bytes to
+        stay under the statement-size cap.
+
+        Args:
+            items (List[Tuple[str, str]]): List of (id, prompt) tuples
+
+        Returns:
+            Dict[str, str]: Mapping of item id to completion text
+        """
+        results: Dict[str, str] = {}
+        batch: List[Tuple[str, str]] = []
+        batch_bytes = 0
+        for item_id, prompt in items:
+            prompt = self._truncate_prompt(prompt)
+            size = len(item_id.encode("utf-8")) + len(prompt.encode("utf-8"))
+            if batch and batch_bytes + size > self.MAX_BATCH_STATEMENT_BYTES:
+                self._execute_complete_batch(batch, results)
+                batch, batch_bytes = [], 0
+            batch.append((item_id, prompt))
+            batch_bytes += size
+        if batch:
+            self._execute_complete_batch(batch, results)
+        return results
+
+    def _execute_complete_batch(
+        self, batch: List[Tuple[str, str]], results: Dict[str, str]
+    ) -> None:
+        """Run one bound VALUES batch and collect its (id, completion) rows."""
+        values = ", ".join(["(%s, %s)"] * len(batch))
+        sql = (
+            f"WITH inputs(id, prompt) AS (SELECT * FROM VALUES {values}) "
+            "SELECT id, SNOWFLAKE.CORTEX.COMPLETE(%s, prompt) FROM inputs"
+        )
+        params: List[str] = []
+        for item_id, prompt in batch:
+            params.extend((item_id, prompt))
+        params.append(self.model)
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params, timeout=self.timeout)
+        for row in cursor.fetchall():
+            results[str(row[0])] = self._postprocess(str(row[1]))
+
+    def generate_descriptions(
+        self,
+        items: List[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Generate descriptions for several items with one server-side batch.
+
+        Unlike the JSON-reply batching the API clients use, the prompts are
+        shipped as a table-valued input and Snowflake evaluates COMPLETE over
+        all of them in a single statement, amortizing planning, RBAC and
+        network costs across the batch. Items the server did not answer fall
+        back to individual generate_description calls.
+
+        Args:
+            items (List[Tuple[str, str]]): List of (id, context) tuples
+            batch_size (Optional[int]): Unused here; chunking is by statement
+                size instead of item count
+            cached_prefix (Optional[str]): Preamble prepended to every
+                item context
+
+        Returns:
+            Dict[str, str]: Mapping of item id to generated description
+        """
+        if not self._conn:
+            # No connection; the base implementation produces the same
+            # per-item error strings generate_description would.
+            return super().generate_descriptions(items, batch_size, cached_prefix)
+
+        pairs = []
+        for item_id, context in items:
+            if cached_prefix:
+                context = f"{cached_prefix}\n\n{context}"
+            pairs.append((item_id, f"{_ITEM_PROMPT}\n\nContext:\n{context}"))
+
+        try:
+            descriptions = self._complete_batch(pairs)
+        except Exception as e:
+            logger.error(f"Error generating batched descriptions with Cortex LLM: {e}")
+            return super().generate_descriptions(items, batch_size, cached_prefix)
+
+        for item_id, context in items:
+            if item_id not in descriptions:
+                if cached_prefix:
+                    context = f"{cached_prefix}\n\n{context}"
+                descriptions[item_id] = self.generate_description(context, _ITEM_PROMPT)
+        return descriptions
+
     def generate_description(self, context: str, prompt: str) -> str:
         """
         Generate a description using Snowflake Cortex.
@@ -69,41 +572,36 @@ class CortexLLMClient(LLMClient):
             return "Error: No Snowflake connection (call connect() first)"
         
         full_prompt = f"{prompt}\n\nContext:\n{context}"
-        # Escape single quotes in the prompt to prevent SQL injection
-        safe_prompt = full_prompt.replace("'", "''")
-        
+
         try:
-            # Limit the prompt size to avoid Snowflake query size limits
-            if len(safe_prompt) > 10000:
-                logger.warning(f"Trimming prompt from {len(safe_prompt)} to 10000 characters")
-                safe_prompt = safe_prompt[:10000]
-            
-            # Call Snowflake Cortex COMPLETE function via SQL with statement timeout
-            # Adding statement_timeout_in_seconds to prevent query from hanging
-            self._conn.cursor().execute("ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = 60")
-            
-            complete_sql = f"SELECT SNOWFLAKE.CORTEX.COMPLETE('{self.model}', '{safe_prompt}')"
-            cursor = self._conn.cursor()
-            cursor.execute(complete_sql)
-            result = cursor.fetchone()
-            
-            # Reset the timeout to default
-            self._conn.cursor().execute("ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = 0")
-            
-            if result and len(result) > 0:
-                return str(result[0]).strip()
-            else:
-                logger.warning("Empty result from Cortex LLM")
-                return "No response from Cortex LLM"
+
+            def _call() -> str:
+                # Limit the prompt size to the model's token budget
+                safe_prompt = self._truncate_prompt(full_prompt)
+
+                # Bind the model and prompt as parameters: the driver handles
+                # quoting, so no manual escaping pass over the prompt. A fresh
+                # cursor per call keeps concurrent worker threads from
+                # interleaving execute/fetch on shared state.
+                cursor = self._conn.cursor()
+                cursor.execute(
+                    "SELECT SNOWFLAKE.CORTEX.COMPLETE(%s, %s)",
+                    (self.model, safe_prompt),
+                    timeout=self.timeout,
+                )
+                result = cursor.fetchone()
+
+                if result and len(result) > 0 and result[0] is not None:
+                    return self._postprocess(str(result[0]))
+                # Raise instead of returning a placeholder so _cached_call
+                # never stores a transient empty result as a permanent hit;
+                # the outer handler falls back or reports the error.
+                raise RuntimeError("Empty result from Cortex LLM")
+
+            return self._cached_call(full_prompt, _call)
         except Exception as e:
             logger.error(f"Error generating description with Cortex LLM: {e}")
-            # Try to reset the timeout even after an error
-            try:
-                self._conn.cursor().execute("ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = 0")
-            except:
-                pass
-                
-            if hasattr(self, 'fallback_client') and self.fallback_client:
+            if self.fallback_client:
                 logger.info("Falling back to alternative LLM provider")
                 return self.fallback_client.generate_description(context, prompt)
             return f"Error generating description: {str(e)}"
@@ -119,22 +617,22 @@ class OpenAILLMClient(LLMClient):
         Args:
             config: LLM configuration
         """
-        try:
-            import openai
-        except ImportError:
+        if openai is None:
             raise ImportError(
                 "The openai package is required to use OpenAI models. "
                 "Install it with 'pip install openai'."
             )
-        
+
         self.model = config.model
         self.api_key = config.api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key must be provided in config or as OPENAI_API_KEY environment variable")
-        
-        self.client = openai.OpenAI(api_key=self.api_key)
+
+        self.client = _shared_sdk_client(openai.OpenAI, api_key=self.api_key)
+        self.aclient = _shared_sdk_client(openai.AsyncOpenAI, api_key=self.api_key)
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens or 500
+        self.stream = config.stream
         
         logger.info(f"Initialized OpenAI client with model: {self.model}")
     
@@ -152,24 +650,81 @@ class OpenAILLMClient(LLMClient):
         full_prompt = f"{prompt}\n\nContext:\n{context}"
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant for generating semantic model descriptions."},
+
+            def _call() -> str:
+                messages = [
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": full_prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            
-            return response.choices[0].message.content.strip()
+                ]
+                if self.stream:
+                    # Accumulate deltas as they arrive so slow generations
+                    # surface tokens (and errors) without waiting for the
+                    # full completion.
+                    parts = []
+                    for chunk in self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                        stream=True,
+                    ):
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                    return self._postprocess("".join(parts))
+
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+                _log_prompt_cache_usage(getattr(response, "usage", None))
+                return self._postprocess(response.choices[0].message.content)
+
+            return self._cached_call(full_prompt, _call)
         except Exception as e:
             logger.error(f"Error generating description with OpenAI: {e}")
-            if hasattr(self, 'fallback_client') and self.fallback_client:
+            if self.fallback_client:
                 logger.info("Falling back to alternative LLM provider")
                 return self.fallback_client.generate_description(context, prompt)
             return "Auto-generated description (error occurred)"
 
+    async def agenerate_description(self, context: str, prompt: str) -> str:
+        """
+        Generate a description using OpenAI's async client.
+
+        Args:
+            context (str): Context information to include in the prompt
+            prompt (str): The prompt template to use
+
+        Returns:
+            str: The generated description
+        """
+        full_prompt = f"{prompt}\n\nContext:\n{context}"
+
+        try:
+
+            def _call():
+                return self.aclient.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": full_prompt}
+                    ],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+
+            response = await _acall_with_retries(_call)
+            _log_prompt_cache_usage(getattr(response, "usage", None))
+            return self._postprocess(response.choices[0].message.content)
+        except Exception as e:
+            logger.error(f"Error generating description with OpenAI: {e}")
+            if self.fallback_client:
+                logger.info("Falling back to alternative LLM provider")
+                return await self.fallback_client.agenerate_description(context, prompt)
+            return "Auto-generated description (error occurred)"
+
 
 class AzureOpenAILLMClient(LLMClient):
     """Client for Azure OpenAI models."""
@@ -181,14 +736,12 @@ class AzureOpenAILLMClient(LLMClient):
         Args:
             config: LLM configuration
         """
-        try:
-            import openai
-        except ImportError:
+        if openai is None:
             raise ImportError(
                 "The openai package is required to use Azure OpenAI models. "
                 "Install it with 'pip install openai'."
             )
-        
+
         self.model = config.model
         self.api_key = config.api_key or os.environ.get("AZURE_OPENAI_API_KEY")
         if not self.api_key:
@@ -203,15 +756,23 @@ class AzureOpenAILLMClient(LLMClient):
         if not self.deployment_name:
             raise ValueError("Azure OpenAI deployment name must be provided in config")
         
-        self.client = openai.AzureOpenAI(
+        self.client = _shared_sdk_client(
+            openai.AzureOpenAI,
             api_key=self.api_key,
             azure_endpoint=self.api_endpoint,
-            api_version=self.api_version
+            api_version=self.api_version,
         )
-        
+        self.aclient = _shared_sdk_client(
+            openai.AsyncAzureOpenAI,
+            api_key=self.api_key,
+            azure_endpoint=self.api_endpoint,
+            api_version=self.api_version,
+        )
+
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens or 500
-        
+        self.stream = config.stream
+
         logger.info(f"Initialized Azure OpenAI client with deployment: {self.deployment_name}")
     
     def generate_description(self, context: str, prompt: str) -> str:
@@ -228,24 +789,78 @@ class AzureOpenAILLMClient(LLMClient):
         full_prompt = f"{prompt}\n\nContext:\n{context}"
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.deployment_name,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant for generating semantic model descriptions."},
+
+            def _call() -> str:
+                messages = [
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": full_prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            
-            return response.choices[0].message.content.strip()
+                ]
+                if self.stream:
+                    parts = []
+                    for chunk in self.client.chat.completions.create(
+                        model=self.deployment_name,
+                        messages=messages,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                        stream=True,
+                    ):
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                    return self._postprocess("".join(parts))
+
+                response = self.client.chat.completions.create(
+                    model=self.deployment_name,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+                _log_prompt_cache_usage(getattr(response, "usage", None))
+                return self._postprocess(response.choices[0].message.content)
+
+            return self._cached_call(full_prompt, _call)
         except Exception as e:
             logger.error(f"Error generating description with Azure OpenAI: {e}")
-            if hasattr(self, 'fallback_client') and self.fallback_client:
+            if self.fallback_client:
                 logger.info("Falling back to alternative LLM provider")
                 return self.fallback_client.generate_description(context, prompt)
             return "Auto-generated description (error occurred)"
 
+    async def agenerate_description(self, context: str, prompt: str) -> str:
+        """
+        Generate a description using Azure OpenAI's async client.
+
+        Args:
+            context (str): Context information to include in the prompt
+            prompt (str): The prompt template to use
+
+        Returns:
+            str: The generated description
+        """
+        full_prompt = f"{prompt}\n\nContext:\n{context}"
+
+        try:
+
+            def _call():
+                return self.aclient.chat.completions.create(
+                    model=self.deployment_name,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": full_prompt}
+                    ],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+
+            response = await _acall_with_retries(_call)
+            _log_prompt_cache_usage(getattr(response, "usage", None))
+            return self._postprocess(response.choices[0].message.content)
+        except Exception as e:
+            logger.error(f"Error generating description with Azure OpenAI: {e}")
+            if self.fallback_client:
+                logger.info("Falling back to alternative LLM provider")
+                return await self.fallback_client.agenerate_description(context, prompt)
+            return "Auto-generated description (error occurred)"
+
 
 class AnthropicLLMClient(LLMClient):
     """Client for Anthropic models."""
@@ -257,22 +872,22 @@ class AnthropicLLMClient(LLMClient):
         Args:
             config: LLM configuration
         """
-        try:
-            import anthropic
-        except ImportError:
+        if anthropic is None:
             raise ImportError(
                 "The anthropic package is required to use Anthropic models. "
                 "Install it with 'pip install anthropic'."
             )
-        
+
         self.model = config.model
         self.api_key = config.api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError("Anthropic API key must be provided in config or as ANTHROPIC_API_KEY environment variable")
-        
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+
+        self.client = _shared_sdk_client(anthropic.Anthropic, api_key=self.api_key)
+        self.aclient = _shared_sdk_client(anthropic.AsyncAnthropic, api_key=self.api_key)
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens or 500
+        self.stream = config.stream
         
         logger.info(f"Initialized Anthropic client with model: {self.model}")
     
@@ -290,64 +905,150 @@ class AnthropicLLMClient(LLMClient):
         full_prompt = f"{prompt}\n\nContext:\n{context}"
         
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                system="You are a helpful assistant for generating semantic model descriptions.",
-                messages=[{"role": "user", "content": full_prompt}],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            
-            return response.content[0].text.strip()
+
+            def _call() -> str:
+                system = [
+                    {
+                        "type": "text",
+                        "text": _SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+                if self.stream:
+                    parts = []
+                    with self.client.messages.stream(
+                        model=self.model,
+                        system=system,
+                        messages=[{"role": "user", "content": full_prompt}],
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                    ) as stream:
+                        for text in stream.text_stream:
+                            parts.append(text)
+                    return self._postprocess("".join(parts))
+
+                response = self.client.messages.create(
+                    model=self.model,
+                    system=system,
+                    messages=[{"role": "user", "content": full_prompt}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+                _log_prompt_cache_usage(getattr(response, "usage", None))
+                return self._postprocess(response.content[0].text)
+
+            return self._cached_call(full_prompt, _call)
         except Exception as e:
             logger.error(f"Error generating description with Anthropic: {e}")
-            if hasattr(self, 'fallback_client') and self.fallback_client:
+            if self.fallback_client:
                 logger.info("Falling back to alternative LLM provider")
                 return self.fallback_client.generate_description(context, prompt)
             return "Auto-generated description (error occurred)"
 
+    async def agenerate_description(self, context: str, prompt: str) -> str:
+        """
+        Generate a description using Anthropic's async client.
+
+        Args:
+            context (str): Context information to include in the prompt
+            prompt (str): The prompt template to use
+
+        Returns:
+            str: The generated description
+        """
+        full_prompt = f"{prompt}\n\nContext:\n{context}"
+
+        try:
+
+            def _call():
+                return self.aclient.messages.create(
+                    model=self.model,
+                    system=[
+                        {
+                            "type": "text",
+                            "text": _SYSTEM_PROMPT,
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                    messages=[{"role": "user", "content": full_prompt}],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+
+            response = await _acall_with_retries(_call)
+            _log_prompt_cache_usage(getattr(response, "usage", None))
+            return self._postprocess(response.content[0].text)
+        except Exception as e:
+            logger.error(f"Error generating description with Anthropic: {e}")
+            if self.fallback_client:
+                logger.info("Falling back to alternative LLM provider")
+                return await self.fallback_client.agenerate_description(context, prompt)
+            return "Auto-generated description (error occurred)"
+
+
+# Map provider to client class. Built once at import time so provider
+# dispatch is a single dict lookup.
+_PROVIDER_MAP = {
+    "cortex": CortexLLMClient,
+    "openai": OpenAILLMClient,
+    "azure_openai": AzureOpenAILLMClient,
+    "anthropic": AnthropicLLMClient,
+}
+
+
+def _build_fallback_client(config: LLMConfig) -> Optional[LLMClient]:
+    """
+    Construct the fallback client named by a configuration, if any.
+
+    Args:
+        config: LLM configuration
+
+    Returns:
+        The fallback client, or None when no (usable) fallback is configured
+    """
+    if not config.fallback_provider or config.fallback_provider == config.provider:
+        return None
+    if config.fallback_provider not in _PROVIDER_MAP:
+        logger.warning(f"Unsupported fallback LLM provider: {config.fallback_provider}")
+        return None
+
+    fallback_config = LLMConfig(
+        provider=config.fallback_provider,
+        model=config.fallback_model or config.model,
+        api_key=config.fallback_api_key,
+        temperature=config.temperature,
+        max_tokens=config.max_tokens,
+    )
+    return _PROVIDER_MAP[config.fallback_provider](fallback_config)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_client(config: LLMConfig) -> LLMClient:
+    """Build the client for a config; LLMConfig is frozen, so it caches."""
+    client = _PROVIDER_MAP[config.provider](config)
+
+    fallback_client = _build_fallback_client(config)
+    if fallback_client is not None:
+        client.fallback_client = fallback_client
+
+    return client
+
 
 def get_llm_client(config: LLMConfig) -> LLMClient:
     """
     Factory function to create the appropriate LLM client based on configuration.
-    
+
+    Repeated calls with an equal configuration return the same client
+    instance, so the SDK's HTTP connection pool (and, for Cortex, the
+    configured session) is reused instead of rebuilt per generated model.
+
     Args:
         config: LLM configuration
-        
+
     Returns:
         An LLM client instance
     """
-    # Map provider to client class
-    provider_map = {
-        "cortex": CortexLLMClient,
-        "openai": OpenAILLMClient,
-        "azure_openai": AzureOpenAILLMClient,
-        "anthropic": AnthropicLLMClient,
-    }
-    
-    if config.provider not in provider_map:
+    if config.provider not in _PROVIDER_MAP:
         raise ValueError(f"Unsupported LLM provider: {config.provider}")
-    
-    # Create the primary client
-    client_class = provider_map[config.provider]
-    client = client_class(config)
-    
-    # Set up fallback if configured
-    if config.fallback_provider and config.fallback_provider != config.provider:
-        if config.fallback_provider not in provider_map:
-            logger.warning(f"Unsupported fallback LLM provider: {config.fallback_provider}")
-        else:
-            # Create a modified config for the fallback
-            fallback_config = LLMConfig(
-                provider=config.fallback_provider,
-                model=config.fallback_model or config.model,
-                api_key=config.fallback_api_key,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
-            )
-            
-            # Create fallback client
-            fallback_client_class = provider_map[config.fallback_provider]
-            client.fallback_client = fallback_client_class(fallback_config)
-            
-    return client 
\ No newline at end of file
+
+    return _cached_client(config)
\ No newline at end of file
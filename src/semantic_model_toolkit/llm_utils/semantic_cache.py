@@ -0,0 +1,144 @@
+"""Semantic response cache for LLM description calls."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+from loguru import logger
+
+# numpy only backs the optional embedding near-hit path; exact SHA-256 hits
+# must keep working on installs without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SemanticCache:
+    """
+    Cache of LLM responses keyed by the full prompt.
+
+    Exact hits are served via a SHA-256 lookup, which costs ~1 ms versus
+    seconds for a live LLM call. When an embedding function is provided, near
+    hits are also served: the query prompt is embedded and the stored response
+    with the highest cosine similarity is returned if it clears the
+    similarity threshold.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        similarity_threshold: float = 0.92,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            path: Path of the sqlite database backing the cache; defaults to
+                an in-memory database scoped to the process
+            embed_fn: Optional function mapping a prompt to an embedding
+                vector (e.g. a sentence-transformers encode or an OpenAI
+                embeddings call). Without it only exact hits are served.
+            similarity_threshold: Minimum cosine similarity for a near hit
+        """
+        if embed_fn is not None and np is None:
+            logger.warning(
+                "numpy is not installed; the semantic cache will serve exact hits only"
+            )
+            embed_fn = None
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "model TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "prompt TEXT NOT NULL, "
+                "response TEXT NOT NULL, "
+                "embedding TEXT, "
+                "PRIMARY KEY (model, key))"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def lookup(self, model: str, prompt: str) -> Optional[str]:
+        """
+        Look up a cached response for the given model and prompt.
+
+        Args:
+            model: Model name the response was generated with
+            prompt: The full prompt text
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        key = self._key(prompt)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE model = ? AND key = ?",
+                (model, key),
+            ).fetchone()
+        if row is not None:
+            return str(row[0])
+
+        if self._embed_fn is None:
+            return None
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT response, embedding FROM responses "
+                "WHERE model = ? AND embedding IS NOT NULL",
+                (model,),
+            ).fetchall()
+        if not rows:
+            return None
+
+        try:
+            query = np.asarray(self._embed_fn(prompt), dtype=np.float64)
+            embeddings = np.asarray(
+                [json.loads(embedding) for _, embedding in rows], dtype=np.float64
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding lookup failed: {e}")
+            return None
+
+        norms = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query)
+        # Guard against zero vectors before dividing.
+        norms[norms == 0] = np.inf
+        similarities = embeddings @ query / norms
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            return str(rows[best][0])
+        return None
+
+    def store(self, model: str, prompt: str, response: str) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            model: Model name the response was generated with
+            prompt: The full prompt text
+            response: The generated response
+        """
+        embedding = None
+        if self._embed_fn is not None:
+            try:
+                embedding = json.dumps(list(self._embed_fn(prompt)))
+            except Exception as e:
+                logger.warning(f"Semantic cache embedding failed; storing exact-only: {e}")
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (model, key, prompt, response, embedding) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (model, self._key(prompt), prompt, response, embedding),
+            )
+            self._conn.commit()
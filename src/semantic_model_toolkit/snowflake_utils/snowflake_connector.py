@@ -98,22 +98,24 @@ def _get_table_comment(
             
             tbl_ddl = (
                 conn.cursor()  # type: ignore[union-attr]
-                .execute(f"select get_ddl('table', '{schema_name}.{table_name}');")
+                .execute("select get_ddl('table', %s);", (f"{schema_name}.{table_name}",))
                 .fetchall()[0][0]
-                .replace("'", "\\'")
             )
-            
+
             # Limit DDL size to avoid query size limits
             if len(tbl_ddl) > 10000:
                 logger.warning(f"Trimming table DDL from {len(tbl_ddl)} to 10000 characters")
                 tbl_ddl = tbl_ddl[:10000]
-                
+
             comment_prompt = f"Here is a table with below DDL: {tbl_ddl} \nPlease provide a business description for the table. Only return the description without any other text."
-            complete_sql = f"select SNOWFLAKE.CORTEX.COMPLETE('{_autogen_model}', '{comment_prompt}')"
-            
-            # Execute with timeout
+
+            # Execute with timeout; parameter binding handles quoting, so no
+            # Python-level escape pass over the prompt.
             cursor = conn.cursor()
-            cursor.execute(complete_sql)
+            cursor.execute(
+                "select SNOWFLAKE.CORTEX.COMPLETE(%s, %s)",
+                (_autogen_model, comment_prompt),
+            )
             result = cursor.fetchall()
             
             # Reset timeout
@@ -159,12 +161,13 @@ Please provide a business description for the column. Only return the descriptio
                 logger.warning(f"Trimming comment prompt from {len(comment_prompt)} to 5000 characters")
                 comment_prompt = comment_prompt[:5000]
                 
-            comment_prompt = comment_prompt.replace("'", "\\'")
-            complete_sql = f"select SNOWFLAKE.CORTEX.COMPLETE('{_autogen_model}', '{comment_prompt}')"
-            
-            # Execute with timeout
+            # Execute with timeout; parameter binding handles quoting, so no
+            # Python-level escape pass over the prompt.
             cursor = conn.cursor()
-            cursor.execute(complete_sql)
+            cursor.execute(
+                "select SNOWFLAKE.CORTEX.COMPLETE(%s, %s)",
+                (_autogen_model, comment_prompt),
+            )
             result = cursor.fetchall()
             
             # Reset timeout
@@ -278,6 +281,47 @@ def get_table_foreign_keys(
         return []
 
 
+def _sample_column_values(
+    conn: SnowflakeConnection,
+    schema_name: str,
+    table_name: str,
+    ndv_per_column: int,
+) -> Dict[str, List[str]]:
+    """
+    Pulls one TABLESAMPLE over the whole table and derives distinct sample
+    values per column in Python, replacing a `select distinct` query per column
+    with a single query per table.
+
+    Args:
+        conn: Snowflake connection
+        schema_name: Fully-qualified schema name
+        table_name: Non-qualified table name
+        ndv_per_column: Number of distinct sample values to keep per column
+
+    Returns:
+        Mapping of column name to sample values; empty if sampling failed.
+    """
+    sample_rows = max(ndv_per_column * 50, 100)
+    try:
+        cursor = conn.cursor()
+        cursor_execute = cursor.execute(
+            f"select * from {schema_name}.{table_name} tablesample ({sample_rows} rows)"
+        )
+        assert cursor_execute is not None, "cursor_execute should not be none "
+        df = pd.DataFrame(
+            cursor_execute.fetchall(), columns=[c.name for c in cursor.description]
+        )
+    except Exception as e:
+        logger.error(f"unable to sample table {schema_name}.{table_name}: {e}")
+        return {}
+
+    # Cast all values to string to ensure the lists are json serializable.
+    return {
+        str(col): [str(v) for v in df[col].dropna().unique()[:ndv_per_column]]
+        for col in df.columns
+    }
+
+
 def get_table_representation(
     conn: SnowflakeConnection,
     schema_name: str,
@@ -289,6 +333,13 @@ def get_table_representation(
 ) -> Table:
     table_comment = _get_table_comment(conn, schema_name, table_name, columns_df)
 
+    # Sample the table once up front instead of querying per column.
+    column_samples: Dict[str, List[str]] = {}
+    if ndv_per_column > 0:
+        column_samples = _sample_column_values(
+            conn, schema_name, table_name, ndv_per_column
+        )
+
     def _get_col(col_index: int, column_row: pd.Series) -> Column:
         return _get_column_representation(
             conn=conn,
@@ -297,6 +348,7 @@ def get_table_representation(
             column_row=column_row,
             column_index=col_index,
             ndv=ndv_per_column,
+            column_values=column_samples.get(column_row[_COLUMN_NAME_COL]),
         )
 
     # If max_workers is 1 or less, process columns sequentially to avoid threading issues
@@ -334,11 +386,13 @@ def _get_column_representation(
     column_row: pd.Series,
     column_index: int,
     ndv: int,
+    column_values: Optional[List[str]] = None,
 ) -> Column:
     column_name = column_row[_COLUMN_NAME_COL]
     column_datatype = column_row[_DATATYPE_COL]
-    column_values = None
-    if ndv > 0:
+    if column_values is None and ndv > 0:
+        # Fall back to a per-column distinct query when no precomputed table
+        # sample is available (e.g. the TABLESAMPLE query failed).
         # Pull sample values.
         try:
             cursor = conn.cursor(DictCursor)
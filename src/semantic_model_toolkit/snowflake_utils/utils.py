@@ -1,23 +1,165 @@
-from typing import Dict, Optional, Union
+import functools
+import hashlib
+import json
+import os
+import string
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
 
+from loguru import logger
 from snowflake.connector import connect
 from snowflake.connector.connection import SnowflakeConnection
 
 from semantic_model_toolkit.data_processing.data_types import FQNParts
 
+# Pooled connections are recycled before Snowflake's server-side termination
+# and typical OAuth token lifetimes; 540 seconds leaves headroom under the
+# common 600-second expiry.
+_DEFAULT_CONN_LIFESPAN_SECONDS = 540
+_CONN_LIFESPAN_ENV_VAR = "SEMANTIC_TOOLKIT_SF_CONN_LIFESPAN_SECONDS"
+
+
+class SnowflakeConnectionPool:
+    """
+    Pool of Snowflake connections with max-lifespan recycling.
+
+    Connections are reused across calls, skipping the TCP + TLS + auth
+    handshake, but are preemptively closed and recreated once they reach the
+    configured lifespan so a long run never loses one to server-side
+    termination or OAuth token expiry mid-query.
+    """
+
+    def __init__(self, lifespan_seconds: Optional[float] = None):
+        """
+        Initialize the connection pool.
+
+        Args:
+            lifespan_seconds: Maximum age of a pooled connection before it is
+                recycled. Defaults to the SEMANTIC_TOOLKIT_SF_CONN_LIFESPAN_SECONDS
+                environment variable, or 540 seconds.
+        """
+        if lifespan_seconds is None:
+            lifespan_seconds = float(
+                os.environ.get(_CONN_LIFESPAN_ENV_VAR, _DEFAULT_CONN_LIFESPAN_SECONDS)
+            )
+        self.lifespan_seconds = lifespan_seconds
+        self._lock = threading.Lock()
+        self._connections: Dict[str, Tuple[SnowflakeConnection, float]] = {}
+
+    @staticmethod
+    def _key(connection_parameters: Dict[str, Union[str, bool]]) -> str:
+        # Non-scalar values (e.g. loaded private key objects) are identified
+        # by repr, which is stable for the lifetime of the object.
+        serialized = json.dumps(
+            {
+                name: value if isinstance(value, (str, bool, int)) else repr(value)
+                for name, value in connection_parameters.items()
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get(
+        self, connection_parameters: Dict[str, Union[str, bool]]
+    ) -> SnowflakeConnection:
+        """
+        Return a pooled connection for the given parameters.
+
+        A cached connection is returned while it is younger than the pool
+        lifespan and still open; otherwise it is closed and a fresh one is
+        created in its place.
+        """
+        key = self._key(connection_parameters)
+        with self._lock:
+            entry = self._connections.get(key)
+            if entry is not None:
+                conn, created_at = entry
+                if (
+                    time.monotonic() - created_at < self.lifespan_seconds
+                    and not conn.is_closed()
+                ):
+                    return conn
+                del self._connections[key]
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close expired Snowflake connection: {e}")
+            conn = _connection(connection_parameters)
+            self._connections[key] = (conn, time.monotonic())
+            return conn
+
+    def close_all(self) -> None:
+        """Close and discard every pooled connection."""
+        with self._lock:
+            for conn, _ in self._connections.values():
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close pooled Snowflake connection: {e}")
+            self._connections.clear()
+
+
+# Shared default pool used by create_snowflake_connection(use_pool=True).
+_DEFAULT_POOL = SnowflakeConnectionPool()
+
+
+def close_pooled_connections() -> None:
+    """Close and discard all connections held by the default pool."""
+    _DEFAULT_POOL.close_all()
+
+
+# ASCII-only uppercase table; SQL identifiers in fully qualified names are
+# ASCII, so this avoids the locale-aware str.upper machinery.
+_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
 
 def create_fqn_table(fqn_str: str) -> FQNParts:
-    if fqn_str.count(".") != 2:
+    # Single translate pass uppercases the whole name at once, and the manual
+    # dot scan fails fast on malformed input instead of the count() + split()
+    # double pass with three per-part upper() allocations.
+    upper = fqn_str.translate(_UPPER)
+    first = upper.find(".")
+    second = upper.find(".", first + 1)
+    third = upper.find(".", second + 1)
+    if first < 0 or second < 0 or third >= 0:
         raise ValueError(
             "Expected to have a table fully qualified name following the {database}.{schema}.{table} format."
             + f"Instead found {fqn_str}"
         )
-    database, schema, table = fqn_str.split(".")
     return FQNParts(
-        database=database.upper(), schema_name=schema.upper(), table=table.upper()
+        database=upper[:first],
+        schema_name=upper[first + 1 : second],
+        table=upper[second + 1 :],
     )
 
 
+# Parameter names forwarded to snowflake.connector.connect when truthy.
+_CONN_PARAM_NAMES = (
+    "user",
+    "account",
+    "password",
+    "role",
+    "warehouse",
+    "database",
+    "schema",
+    "host",
+    "authenticator",
+    "passcode",
+    "passcode_in_password",
+    "token",
+)
+
+
+def _build_conn_params(**kwargs: Union[str, bool, None]) -> Dict[str, Union[str, bool]]:
+    """Build a connection-parameter dict from the truthy known arguments."""
+    return {
+        name: value
+        for name, value in kwargs.items()
+        if name in _CONN_PARAM_NAMES and value not in (None, False, "")
+    }
+
+
 def create_connection_parameters(
     user: str,
     account: str,
@@ -31,28 +173,40 @@ def create_connection_parameters(
     passcode: Optional[str] = None,
     passcode_in_password: Optional[bool] = None,
 ) -> Dict[str, Union[str, bool]]:
-    connection_parameters: Dict[str, Union[str, bool]] = dict(
-        user=user, account=account
+    return _build_conn_params(
+        user=user,
+        account=account,
+        password=password,
+        host=host,
+        role=role,
+        warehouse=warehouse,
+        database=database,
+        schema=schema,
+        authenticator=authenticator,
+        passcode=passcode,
+        passcode_in_password=passcode_in_password,
     )
-    if password:
-        connection_parameters["password"] = password
-    if role:
-        connection_parameters["role"] = role
-    if warehouse:
-        connection_parameters["warehouse"] = warehouse
-    if database:
-        connection_parameters["database"] = database
-    if schema:
-        connection_parameters["schema"] = schema
-    if authenticator:
-        connection_parameters["authenticator"] = authenticator
-    if host:
-        connection_parameters["host"] = host
-    if passcode:
-        connection_parameters["passcode"] = passcode
-    if passcode_in_password:
-        connection_parameters["passcode_in_password"] = passcode_in_password
-    return connection_parameters
+
+
+@functools.lru_cache(maxsize=8)
+def _load_private_key(private_key_path: str, mtime_ns: int, passphrase: Optional[str]):
+    """
+    Load and deserialize a PEM private key, cached by path and mtime.
+
+    PEM parsing (and decryption, for passphrase-protected keys) is
+    CPU-intensive; reconnects reuse the deserialized key object instead of
+    re-reading and re-parsing the file. The mtime argument invalidates the
+    cached entry when the key file changes on disk.
+    """
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    with open(private_key_path, "rb") as key:
+        return load_pem_private_key(
+            key.read(),
+            password=passphrase.encode() if passphrase else None,
+            backend=default_backend(),
+        )
 
 
 def _connection(
@@ -104,6 +258,7 @@ def create_snowflake_connection(
     private_key_passphrase: Optional[str] = None,
     token: Optional[str] = None,
     authenticator: Optional[str] = None,
+    use_pool: bool = False,
 ) -> SnowflakeConnection:
     """
     Creates a Snowflake connection with the provided parameters.
@@ -127,48 +282,32 @@ def create_snowflake_connection(
         private_key_passphrase: Passphrase for the private key
         token: OAuth token for token-based authentication
         authenticator: Authenticator for external browser/SSO auth
-        
+        use_pool: Reuse a connection from the default pool, which recycles
+            connections past their configured lifespan
+
     Returns:
         A Snowflake connection
     """
-    connection_params = {
-        "user": user,
-        "account": account,
-    }
-    
-    # Add optional parameters
-    if password:
-        connection_params["password"] = password
-    if role:
-        connection_params["role"] = role
-    if warehouse:
-        connection_params["warehouse"] = warehouse
-    if database:
-        connection_params["database"] = database
-    if schema:
-        connection_params["schema"] = schema
-    if host:
-        connection_params["host"] = host
-    if authenticator:
-        connection_params["authenticator"] = authenticator
-        
+    connection_params = _build_conn_params(
+        user=user,
+        account=account,
+        password=password,
+        role=role,
+        warehouse=warehouse,
+        database=database,
+        schema=schema,
+        host=host,
+        authenticator=authenticator,
+        token=token,
+    )
+
     # Key pair authentication
     if private_key_path:
-        import os
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives.serialization import load_pem_private_key
-        
-        with open(os.path.expanduser(private_key_path), "rb") as key:
-            p_key = load_pem_private_key(
-                key.read(),
-                password=private_key_passphrase.encode() if private_key_passphrase else None,
-                backend=default_backend()
-            )
-            
-        connection_params["private_key"] = p_key
-        
-    # OAuth token
-    if token:
-        connection_params["token"] = token
-        
+        key_path = os.path.expanduser(private_key_path)
+        connection_params["private_key"] = _load_private_key(
+            key_path, os.stat(key_path).st_mtime_ns, private_key_passphrase
+        )
+
+    if use_pool:
+        return _DEFAULT_POOL.get(connection_params)
     return connect(**connection_params)
@@ -0,0 +1,27 @@
+"""Regression tests for import-order cycles between the top-level modules."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Each module must be importable first, in a fresh interpreter, without
+# tripping the generate_model -> core.config -> core -> model_generator
+# import cycle.
+_ENTRY_MODULES = [
+    "semantic_model_toolkit",
+    "semantic_model_toolkit.generate_model",
+    "semantic_model_toolkit.core.model_generator",
+    "semantic_model_toolkit.snowflake_utils.snowflake_connector",
+    "semantic_model_toolkit.llm_utils.llm_client",
+]
+
+
+@pytest.mark.parametrize("module", _ENTRY_MODULES)
+def test_module_imports_first(module):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
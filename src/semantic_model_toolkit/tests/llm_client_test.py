@@ -0,0 +1,198 @@
+import json
+
+import pytest
+
+from semantic_model_toolkit.core.config import LLMConfig
+from semantic_model_toolkit.llm_utils.llm_client import (
+    _BATCH_PROMPT,
+    _ITEM_PROMPT,
+    CortexLLMClient,
+    LLMClient,
+    _parse_json_object,
+)
+
+
+class _FakeLLMClient(LLMClient):
+    """Scriptable client: batch prompts get queued replies, items get echoes."""
+
+    def __init__(self, batch_replies):
+        self.batch_replies = list(batch_replies)
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    def generate_description(self, context, prompt):
+        if prompt == _BATCH_PROMPT:
+            self.batch_calls += 1
+            return self.batch_replies.pop(0)
+        self.single_calls += 1
+        return f"single description for {context}"
+
+
+class _FakeCursor:
+    """Echoes one (id, description) row per bound (id, prompt) pair."""
+
+    def __init__(self, executed):
+        self._executed = executed
+        self._rows = []
+
+    def execute(self, sql, params=None, timeout=None):
+        self._executed.append((sql, list(params or [])))
+        pairs = list(params or [])[:-1]
+        self._rows = [
+            (pairs[i], f"description for {pairs[i]}") for i in range(0, len(pairs), 2)
+        ]
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return _FakeCursor(self.executed)
+
+    def is_closed(self):
+        return False
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("  plain description  ", "plain description"),
+        ("Sure! Here's the description: a table", "a table"),
+        ("Here is the description of the column:\nCustomer id", "Customer id"),
+        ("Sure, the customer's unique identifier.", "the customer's unique identifier."),
+        ("", ""),
+    ],
+)
+def test_postprocess_strips_whitespace_and_preambles(raw, expected):
+    assert LLMClient._postprocess(raw) == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        # "sure" must only match as a whole word.
+        "Surely the customer's unique identifier.",
+        # Colons in a legitimate first sentence must survive.
+        "Here is where orders are stored, including: date, id.",
+        "A table: keeps orders",
+        "Stores key: value pairs per customer.",
+    ],
+)
+def test_postprocess_preserves_valid_replies(raw):
+    assert LLMClient._postprocess(raw) == raw
+
+
+@pytest.mark.parametrize(
+    "reply, expected",
+    [
+        ('{"a": "first", "b": "second"}', {"a": "first", "b": "second"}),
+        ('Sure! Here you go:\n{"a": "first"}\nLet me know!', {"a": "first"}),
+        ('["not", "a", "dict"]', None),
+        ("no json here", None),
+        ('{"unterminated": ', None),
+    ],
+)
+def test_parse_json_object(reply, expected):
+    assert _parse_json_object(reply) == expected
+
+
+def test_generate_descriptions_batches_via_json_reply():
+    client = _FakeLLMClient([json.dumps({"a": "table of orders", "b": "customer id"})])
+
+    descriptions = client.generate_descriptions([("a", "ctx a"), ("b", "ctx b")])
+
+    assert descriptions == {"a": "table of orders", "b": "customer id"}
+    assert client.batch_calls == 1
+    assert client.single_calls == 0
+
+
+def test_generate_descriptions_halves_batch_on_malformed_json():
+    # The 4-item batch and both 2-item halves return garbage, so every item
+    # must land on the single-item path exactly once.
+    client = _FakeLLMClient(["garbage"] * 3)
+    items = [(f"id{i}", f"ctx {i}") for i in range(4)]
+
+    descriptions = client.generate_descriptions(items)
+
+    assert set(descriptions) == {"id0", "id1", "id2", "id3"}
+    assert all(d.startswith("single description") for d in descriptions.values())
+    assert client.batch_calls == 3
+    assert client.single_calls == 4
+
+
+def test_generate_descriptions_retries_ids_missing_from_reply():
+    client = _FakeLLMClient([json.dumps({"a": "table of orders"})])
+
+    descriptions = client.generate_descriptions([("a", "ctx a"), ("b", "ctx b")])
+
+    assert descriptions["a"] == "table of orders"
+    assert descriptions["b"].startswith("single description")
+    assert client.single_calls == 1
+
+
+def _cortex_client():
+    client = CortexLLMClient(LLMConfig(provider="cortex", model="llama3-8b"))
+    conn = _FakeConnection()
+    client.connect(conn)
+    return client, conn
+
+
+def test_cortex_complete_batch_single_statement():
+    client, conn = _cortex_client()
+
+    results = client._complete_batch([("a", "prompt a"), ("b", "prompt b")])
+
+    assert results == {"a": "description for a", "b": "description for b"}
+    assert len(conn.executed) == 1
+    sql, params = conn.executed[0]
+    assert sql.count("(%s, %s)") == 2
+    assert params == ["a", "prompt a", "b", "prompt b", "llama3-8b"]
+
+
+def test_cortex_complete_batch_chunks_by_statement_bytes():
+    client, conn = _cortex_client()
+    client.MAX_BATCH_STATEMENT_BYTES = 40
+    items = [(f"id{i}", "p" * 20) for i in range(4)]
+
+    results = client._complete_batch(items)
+
+    assert set(results) == {"id0", "id1", "id2", "id3"}
+    # 25 bytes per item against a 40-byte budget: one statement per item.
+    assert len(conn.executed) == 4
+
+
+def test_cortex_empty_result_is_not_cached():
+    from semantic_model_toolkit.llm_utils.semantic_cache import SemanticCache
+
+    class _EmptyCursor:
+        def execute(self, sql, params=None, timeout=None):
+            pass
+
+        def fetchone(self):
+            return None
+
+        def fetchall(self):
+            return []
+
+    class _EmptyConnection:
+        def cursor(self):
+            return _EmptyCursor()
+
+        def is_closed(self):
+            return False
+
+    client = CortexLLMClient(LLMConfig(provider="cortex", model="llama3-8b"))
+    client.connect(_EmptyConnection())
+    client.cache = SemanticCache()
+
+    reply = client.generate_description("ctx", "describe")
+
+    assert reply.startswith("Error generating description:")
+    assert client.cache.lookup("llama3-8b", "describe\n\nContext:\nctx") is None
@@ -0,0 +1,56 @@
+from semantic_model_toolkit.llm_utils.semantic_cache import SemanticCache
+
+# Toy embedding space: prompts about orders point one way, prompts about
+# customers the other, so cosine similarity separates them cleanly.
+_EMBEDDINGS = {
+    "describe the orders table": [1.0, 0.0],
+    "please describe the orders table": [0.99, 0.1],
+    "describe the customers table": [0.0, 1.0],
+}
+
+
+def test_exact_hit_round_trip():
+    cache = SemanticCache()
+
+    cache.store("llama3-8b", "describe the orders table", "Stores orders.")
+
+    assert cache.lookup("llama3-8b", "describe the orders table") == "Stores orders."
+
+
+def test_miss_without_embed_fn():
+    cache = SemanticCache()
+    cache.store("llama3-8b", "describe the orders table", "Stores orders.")
+
+    assert cache.lookup("llama3-8b", "describe the ORDERS table") is None
+
+
+def test_entries_are_scoped_per_model():
+    cache = SemanticCache()
+    cache.store("llama3-8b", "describe the orders table", "Stores orders.")
+
+    assert cache.lookup("mistral-7b", "describe the orders table") is None
+
+
+def test_store_replaces_existing_entry():
+    cache = SemanticCache()
+    cache.store("llama3-8b", "describe the orders table", "old")
+    cache.store("llama3-8b", "describe the orders table", "new")
+
+    assert cache.lookup("llama3-8b", "describe the orders table") == "new"
+
+
+def test_near_hit_via_embeddings():
+    cache = SemanticCache(embed_fn=_EMBEDDINGS.__getitem__)
+    cache.store("llama3-8b", "describe the orders table", "Stores orders.")
+
+    assert (
+        cache.lookup("llama3-8b", "please describe the orders table")
+        == "Stores orders."
+    )
+
+
+def test_near_miss_below_threshold():
+    cache = SemanticCache(embed_fn=_EMBEDDINGS.__getitem__)
+    cache.store("llama3-8b", "describe the orders table", "Stores orders.")
+
+    assert cache.lookup("llama3-8b", "describe the customers table") is None
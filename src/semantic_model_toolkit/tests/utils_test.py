@@ -1,7 +1,12 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from semantic_model_toolkit.data_processing.data_types import FQNParts
-from semantic_model_toolkit.snowflake_utils.utils import create_fqn_table
+from semantic_model_toolkit.snowflake_utils.utils import (
+    SnowflakeConnectionPool,
+    create_fqn_table,
+)
 
 
 def test_fqn_creation():
@@ -18,3 +23,68 @@ def test_fqn_creation_invalid_name():
     input_name = "database.schema table"
     with pytest.raises(ValueError):
         create_fqn_table(input_name)
+
+
+def _pool_with_stub_clock(monkeypatch, lifespan_seconds=100.0):
+    pool = SnowflakeConnectionPool(lifespan_seconds=lifespan_seconds)
+    clock = {"now": 0.0}
+    monkeypatch.setattr(
+        "semantic_model_toolkit.snowflake_utils.utils.time.monotonic",
+        lambda: clock["now"],
+    )
+    monkeypatch.setattr(
+        "semantic_model_toolkit.snowflake_utils.utils._connection",
+        lambda params: MagicMock(is_closed=MagicMock(return_value=False)),
+    )
+    return pool, clock
+
+
+def test_pool_reuses_connection_for_equal_params(monkeypatch):
+    pool, _ = _pool_with_stub_clock(monkeypatch)
+    params = {"account": "acct", "user": "u"}
+
+    assert pool.get(params) is pool.get(dict(params))
+
+
+def test_pool_keys_connections_by_params(monkeypatch):
+    pool, _ = _pool_with_stub_clock(monkeypatch)
+
+    first = pool.get({"account": "acct", "user": "u1"})
+    second = pool.get({"account": "acct", "user": "u2"})
+
+    assert first is not second
+
+
+def test_pool_recycles_connection_past_lifespan(monkeypatch):
+    pool, clock = _pool_with_stub_clock(monkeypatch, lifespan_seconds=100.0)
+    params = {"account": "acct", "user": "u"}
+
+    first = pool.get(params)
+    clock["now"] = 99.0
+    assert pool.get(params) is first
+
+    clock["now"] = 101.0
+    second = pool.get(params)
+    assert second is not first
+    first.close.assert_called_once()
+
+
+def test_pool_replaces_closed_connection(monkeypatch):
+    pool, _ = _pool_with_stub_clock(monkeypatch)
+    params = {"account": "acct", "user": "u"}
+
+    first = pool.get(params)
+    first.is_closed.return_value = True
+
+    assert pool.get(params) is not first
+
+
+def test_pool_close_all_closes_and_clears(monkeypatch):
+    pool, _ = _pool_with_stub_clock(monkeypatch)
+    params = {"account": "acct", "user": "u"}
+    first = pool.get(params)
+
+    pool.close_all()
+
+    first.close.assert_called_once()
+    assert pool.get(params) is not first